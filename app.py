@@ -15,6 +15,12 @@ try:
 except ImportError:
     HAS_DOCX = False
 
+try:
+    import pypdfium2 as pdfium
+    HAS_PYPDFIUM2 = True
+except ImportError:
+    HAS_PYPDFIUM2 = False
+
 try:
     import pdfplumber
     HAS_PDFPLUMBER = True
@@ -30,7 +36,32 @@ except LookupError:
 
 # ========== 1. TEXT EXTRACTION HELPERS ==========
 
+def _extract_text_with_pdfium(file_bytes: bytes) -> str:
+    text_parts = []
+    pdf = pdfium.PdfDocument(file_bytes)
+    try:
+        for page in pdf:
+            # PDFium marks a hyphen at a line break as U+FFFE; restore it as "-\n" like
+            # pdfplumber, then strip line padding and blank lines so the layout matches
+            raw = page.get_textpage().get_text_range().replace("\ufffe", "-\n")
+            t = "\n".join(ln for ln in (l.strip() for l in raw.splitlines()) if ln)
+            if t:
+                text_parts.append(t)
+    finally:
+        pdf.close()
+    return "\n".join(text_parts)
+
+
 def extract_text_from_pdf(file_bytes: bytes) -> str:
+    # pypdfium2 (installed with pdfplumber) reads embedded text far faster than pdfminer;
+    # files PDFium can't open still get a try with pdfplumber below
+    if HAS_PYPDFIUM2:
+        try:
+            return _extract_text_with_pdfium(file_bytes)
+        except pdfium.PdfiumError:
+            if not HAS_PDFPLUMBER:
+                raise
+
     if not HAS_PDFPLUMBER:
         raise RuntimeError("pdfplumber is not installed. Run: pip install pdfplumber")
     text_parts = []
@@ -55,16 +86,40 @@ def extract_text_from_docx(file_bytes: bytes) -> str:
 
 def extract_text_from_image(file_bytes: bytes) -> str:
     img = Image.open(io.BytesIO(file_bytes))
+    # Tesseract binarises anyway, so hand it a single-channel image. convert() drops
+    # .format, and pytesseract would then re-save the temp file as PNG; keep the
+    # upload's own format. Alpha/palette images are left alone so transparency
+    # isn't flattened to black.
+    if img.mode in ("RGB", "CMYK"):
+        gray = img.convert("L")
+        gray.format = img.format
+        img = gray
     text = pytesseract.image_to_string(img)
     return text
 
 
+@st.cache_data(show_spinner="Reading document…", max_entries=16, ttl=3600)
+def extract_text_cached(name: str, file_bytes: bytes) -> str:
+    """
+    Dispatch on extension; keyed on the file contents so re-uploading the same
+    judgment skips PDF parsing / OCR.
+    """
+    if name.endswith(".pdf"):
+        return extract_text_from_pdf(file_bytes)
+    if name.endswith(".docx"):
+        return extract_text_from_docx(file_bytes)
+    return extract_text_from_image(file_bytes)
+
+
 def text_to_sentences(text: str) -> List[str]:
     return [s.strip() for s in sent_tokenize(text) if s.strip()]
 
 
 # ========== 2. STRUCTURED BLOCK BUILDING (FACTS / ISSUES / ARGS / REASONING / ORDER / STATUTES) ==========
 
+_IPC_MENTION_RE = re.compile(r"(ipc|indian penal code)", flags=re.IGNORECASE)
+
+
 def extract_statutes_block(full_text: str) -> str:
     """
     Roughly mimic your statutes_text: grab any line that mentions IPC / Indian Penal Code.
@@ -73,7 +128,7 @@ def extract_statutes_block(full_text: str) -> str:
     lines = full_text.splitlines()
     hits = []
     for ln in lines:
-        if re.search(r"(ipc|indian penal code)", ln, flags=re.IGNORECASE):
+        if _IPC_MENTION_RE.search(ln):
             hits.append(ln.strip())
     if not hits:
         return ""
@@ -84,6 +139,82 @@ def extract_statutes_block(full_text: str) -> str:
     return joined
 
 
+def _keyword_re(*keywords: str) -> re.Pattern:
+    """One alternation per bucket, so each sentence is scanned once per bucket."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# ORDER
+_ORDER_RE = _keyword_re(
+    "appeal is dismissed",
+    "appeal stands dismissed",
+    "appeal is allowed",
+    "appeal is partly allowed",
+    "conviction is upheld",
+    "sentence of death",
+    "sentence is upheld",
+    "sentence is confirmed",
+    "in the result, the appeal",
+    "in the result, we",
+)
+
+# REASONING
+_REASONING_RE = _keyword_re(
+    "we are of the view",
+    "we are of the considered view",
+    "we find that",
+    "it is clear that",
+    "it appears to us",
+    "in our view",
+    "in our considered opinion",
+    "upon an evaluation of the evidentiary record",
+    "upon an evaluation of the record",
+)
+
+# ISSUES
+_ISSUES_RE = _keyword_re(
+    "the central question requiring determination",
+    "the question requiring determination",
+    "the question for consideration",
+    "the short question",
+    "the principal issue",
+    "the core issue",
+    "the main issue",
+    "whether the case falls within the category",
+)
+
+# APPELLANT / ACCUSED ARGUMENTS
+_APPELLANT_ARGS_RE = _keyword_re(
+    "learned counsel for the appellants submitted",
+    "learned counsel for the appellant submitted",
+    "counsel for the appellants submitted",
+    "counsel for the appellant submitted",
+    "on behalf of the appellants, it was submitted",
+)
+
+# RESPONDENT / STATE ARGUMENTS
+_RESPONDENT_ARGS_RE = _keyword_re(
+    "per contra, learned counsel for the state contended",
+    "learned counsel for the state contended",
+    "on the other hand, learned counsel for the state",
+    "per contra, the state argued",
+    "counsel for the state argued",
+)
+
+# FACTS / PROSECUTION CASE
+_FACTS_RE = _keyword_re(
+    "the prosecution case in a nutshell is",
+    "the prosecution case in brief is",
+    "the prosecution case, in brief, is as follows",
+    "the facts, in brief, are",
+    "the relevant facts are",
+    "the material facts are",
+    "on the fateful day",
+    "the deceased was residing",
+    "the present appeal before this court arises from",
+)
+
+
 def build_structured_blocks(sentences: List[str], full_text: str):
     """
     Heuristic bucketing so that we can fill:
@@ -104,106 +235,38 @@ def build_structured_blocks(sentences: List[str], full_text: str):
     reasoning = []
     order = []
 
-    for s in sentences:
-        low = s.lower()
+    # Lower-case every sentence once; the keyword loop and fallbacks reuse it
+    lowered = [s.lower() for s in sentences]
+
+    for s, low in zip(sentences, lowered):
 
         # ORDER
-        if any(
-            kw in low
-            for kw in [
-                "appeal is dismissed",
-                "appeal stands dismissed",
-                "appeal is allowed",
-                "appeal is partly allowed",
-                "conviction is upheld",
-                "sentence of death",
-                "sentence is upheld",
-                "sentence is confirmed",
-                "in the result, the appeal",
-                "in the result, we",
-            ]
-        ):
+        if _ORDER_RE.search(low):
             order.append(s)
             continue
 
         # REASONING
-        if any(
-            kw in low
-            for kw in [
-                "we are of the view",
-                "we are of the considered view",
-                "we find that",
-                "it is clear that",
-                "it appears to us",
-                "in our view",
-                "in our considered opinion",
-                "upon an evaluation of the evidentiary record",
-                "upon an evaluation of the record",
-            ]
-        ):
+        if _REASONING_RE.search(low):
             reasoning.append(s)
             continue
 
         # ISSUES
-        if any(
-            kw in low
-            for kw in [
-                "the central question requiring determination",
-                "the question requiring determination",
-                "the question for consideration",
-                "the short question",
-                "the principal issue",
-                "the core issue",
-                "the main issue",
-                "whether the case falls within the category",
-            ]
-        ):
+        if _ISSUES_RE.search(low):
             issues.append(s)
             continue
 
         # APPELLANT / ACCUSED ARGUMENTS
-        if any(
-            kw in low
-            for kw in [
-                "learned counsel for the appellants submitted",
-                "learned counsel for the appellant submitted",
-                "counsel for the appellants submitted",
-                "counsel for the appellant submitted",
-                "on behalf of the appellants, it was submitted",
-            ]
-        ):
+        if _APPELLANT_ARGS_RE.search(low):
             app_args.append(s)
             continue
 
         # RESPONDENT / STATE ARGUMENTS
-        if any(
-            kw in low
-            for kw in [
-                "per contra, learned counsel for the state contended",
-                "learned counsel for the state contended",
-                "on the other hand, learned counsel for the state",
-                "per contra, the state argued",
-                "counsel for the state argued",
-            ]
-        ):
+        if _RESPONDENT_ARGS_RE.search(low):
             resp_args.append(s)
             continue
 
         # FACTS / PROSECUTION CASE
-        if any(
-            kw in low
-            for kw in [
-                "the prosecution case in a nutshell is",
-                "the prosecution case in brief is",
-                "the prosecution case, in brief, is as follows",
-                "the facts, in brief, are",
-                "the relevant facts are",
-                "the material facts are",
-                "on the fateful day",
-                "the deceased was residing",
-                "the present appeal before this court arises from",
-            ]
-        ):
+        if _FACTS_RE.search(low):
             facts.append(s)
             continue
 
@@ -214,28 +277,28 @@ def build_structured_blocks(sentences: List[str], full_text: str):
 
     if not issues:
         # Maybe the main issue is phrased differently
-        candidates = [s for s in sentences if "whether" in s.lower()]
+        candidates = [s for s, low in zip(sentences, lowered) if "whether" in low]
         if candidates:
             issues = [candidates[0]]
 
     if not app_args and sentences:
         # Take any sentence with "appellant" / "accused"
-        cand = [s for s in sentences if "appellant" in s.lower() or "accused" in s.lower()]
+        cand = [s for s, low in zip(sentences, lowered) if "appellant" in low or "accused" in low]
         if cand:
             app_args = [cand[0]]
 
     if not resp_args and sentences:
-        cand = [s for s in sentences if "state" in s.lower() or "respondent" in s.lower()]
+        cand = [s for s, low in zip(sentences, lowered) if "state" in low or "respondent" in low]
         if cand:
             resp_args = [cand[0]]
 
     if not reasoning and sentences:
-        cand = [s for s in sentences if "therefore" in s.lower() or "thus" in s.lower()]
+        cand = [s for s, low in zip(sentences, lowered) if "therefore" in low or "thus" in low]
         if cand:
             reasoning = [cand[0]]
 
     if not order and sentences:
-        cand = [s for s in sentences if "in the result" in s.lower()]
+        cand = [s for s, low in zip(sentences, lowered) if "in the result" in low]
         if cand:
             order = [cand[0]]
 
@@ -260,6 +323,9 @@ def build_structured_blocks(sentences: List[str], full_text: str):
 
 # ========== 3. EXACT SUMMARY LOGIC FROM YOUR NOTEBOOK ==========
 
+# Only the first sentence of each block is used, so callers split with maxsplit=1
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[\.\?\!])\s+')
+
 def generate_summaries(
     facts_text: str,
     issues_text: str,
@@ -280,7 +346,7 @@ def generate_summaries(
         return s[0].lower() + s[1:] if s else s
 
     def first_sentence(text: str) -> str:
-        parts = re.split(r'(?<=[\.\?\!])\s+', text.strip())
+        parts = _SENTENCE_BOUNDARY_RE.split(text.strip(), maxsplit=1)
         return parts[0] if parts else text.strip()
 
     # ------------------------------------------------------------
@@ -401,7 +467,7 @@ def generate_summaries(
     def first_sentence_lay(text: str) -> str:
         if not text:
             return ""
-        parts = re.split(r'(?<=[\.\?\!])\s+', text.strip())
+        parts = _SENTENCE_BOUNDARY_RE.split(text.strip(), maxsplit=1)
         return parts[0] if parts else text.strip()
 
     # Take the previously extracted blocks and clean them for layman
@@ -514,12 +580,7 @@ def main():
 
     # 1) Extract raw text
     try:
-        if name.endswith(".pdf"):
-            raw_text = extract_text_from_pdf(file_bytes)
-        elif name.endswith(".docx"):
-            raw_text = extract_text_from_docx(file_bytes)
-        else:
-            raw_text = extract_text_from_image(file_bytes)
+        raw_text = extract_text_cached(name, file_bytes)
     except Exception as e:
         st.error(f"Error reading file: {e}")
         return
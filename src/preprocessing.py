@@ -1,15 +1,33 @@
 import fitz  # PyMuPDF
 import json
 import nltk
-nltk.download('punkt')
-from nltk.tokenize import sent_tokenize
 import os
+from functools import lru_cache
+
+def _ensure_punkt(resource):
+    """Download an nltk punkt resource ('punkt' / 'punkt_tab') only if it isn't installed."""
+    try:
+        nltk.data.find(f'tokenizers/{resource}')
+    except LookupError:
+        nltk.download(resource, quiet=True)
+
+@lru_cache(maxsize=1)
+def _sentence_tokenizer():
+    """The pretrained English punkt model that sent_tokenize uses, loaded once."""
+    try:
+        from nltk.tokenize import PunktTokenizer  # nltk >= 3.9, reads punkt_tab
+    except ImportError:
+        _ensure_punkt('punkt')
+        return nltk.data.load('tokenizers/punkt/english.pickle')
+    _ensure_punkt('punkt_tab')
+    return PunktTokenizer('english')
 
 def parse_pdf_to_sentences(pdf_path, out_path=None):
     """
     Extracts text page-by-page, splits into sentences,
     and keeps (page, start_char, end_char) offsets.
     """
+    tokenizer = _sentence_tokenizer()
     doc = fitz.open(pdf_path)
     all_records = []
 
@@ -17,24 +35,16 @@ def parse_pdf_to_sentences(pdf_path, out_path=None):
         page = doc.load_page(pno)
         text = page.get_text("text")
 
-        # sentence tokenize
-        sentences = sent_tokenize(text)
-
-        cursor = 0
-        for i, sent in enumerate(sentences):
-            idx = text.find(sent, cursor)
-            if idx == -1:
-                idx = cursor  # fallback
-
+        # sentence tokenize; punkt reports exact offsets, no need to search for them
+        for i, (start, end) in enumerate(tokenizer.span_tokenize(text)):
             record = {
                 "page": pno,
                 "line_id": i,
-                "start_char": idx,
-                "end_char": idx + len(sent),
-                "text": sent
+                "start_char": start,
+                "end_char": end,
+                "text": text[start:end]
             }
             all_records.append(record)
-            cursor = idx + len(sent)
 
     if out_path:
         with open(out_path, "w", encoding="utf-8") as f:
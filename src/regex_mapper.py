@@ -87,19 +87,26 @@ def build_statute_patterns():
 
     return patterns
 
+# Compiled once at import; callers that don't pass their own patterns reuse these.
+# A tuple so no caller can mutate the shared default in place.
+STATUTE_PATTERNS = tuple(build_statute_patterns())
+
+# Every built-in pattern needs at least one ASCII digit to match
+_DIGIT_RE = re.compile(r'[0-9]')
+
 # 2. Text normalization
 # =============================
 
 ZERO_WIDTH = ['\u200b', '\u200c', '\u200d', '\ufeff']
 
+# NBSP to space and zero-width chars dropped in a single translate pass
+_MATCHING_TABLE = str.maketrans({'\u00A0': ' ', **{z: None for z in ZERO_WIDTH}})
+_WHITESPACE_RE = re.compile(r'\s+')
+
 def normalize_text_for_matching(s: str):
     if s is None:
         return ""
-    s2 = s.replace('\u00A0', ' ')  # NBSP to space
-    for z in ZERO_WIDTH:
-        s2 = s2.replace(z, '')
-    s2 = re.sub(r'\s+', ' ', s2)
-    return s2
+    return _WHITESPACE_RE.sub(' ', s.translate(_MATCHING_TABLE))
 
 # 3. Find statutes in a given sentence
 # =============================
@@ -119,12 +126,17 @@ def find_statutes_in_text(text, patterns=None):
     if text is None:
         return []
 
-    patterns = patterns or build_statute_patterns()
+    patterns = patterns or STATUTE_PATTERNS
+
+    # Nothing can match the built-in patterns without a digit (junk OCR, prose)
+    if patterns is STATUTE_PATTERNS and not _DIGIT_RE.search(text):
+        return []
 
     s = text
     norm = normalize_text_for_matching(s)
 
     results = []
+    lower_s = None  # lowered lazily, at most once per text
 
     # We search on normalized, but span mapping happens on raw
     for pname, pat in patterns:
@@ -136,8 +148,9 @@ def find_statutes_in_text(text, patterns=None):
             idx = s.find(raw_group)
             if idx == -1:
                 # fallback: try case-insensitive search
-                lower_raw = raw_group.lower()
-                idx = s.lower().find(lower_raw)
+                if lower_s is None:
+                    lower_s = s.lower()
+                idx = lower_s.find(raw_group.lower())
 
             if idx != -1:
                 results.append({
@@ -168,12 +181,19 @@ def map_jsonl_file_to_hits(jsonl_path, out_csv, include_legal_terms=True, filter
 
     # import local build/find if they exist; otherwise the notebook-level functions will be used during runtime.
     try:
-        from src.regex_mapper import build_statute_patterns as _bp  # guard to avoid recursion when reloading
-        patterns = _bp()
+        from src.regex_mapper import STATUTE_PATTERNS as _patterns  # guard to avoid recursion when reloading
+        patterns = _patterns
     except Exception:
         # Patterns will be taken from notebook definitions if present
         patterns = None
 
+    # call notebook-level find_statutes_in_text if module-level isn't available
+    try:
+        from src.regex_mapper import find_statutes_in_text as finder
+    except Exception:
+        # fallback to expecting find_statutes_in_text defined in the notebook's global scope
+        finder = find_statutes_in_text
+
     rows = []
     with open(jsonl_path, "r", encoding="utf-8") as fin:
         for line_no, line in enumerate(fin):
@@ -183,13 +203,7 @@ def map_jsonl_file_to_hits(jsonl_path, out_csv, include_legal_terms=True, filter
             line_id = rec.get("line_id")
             start_char = rec.get("start_char")
 
-            # call notebook-level find_statutes_in_text if module-level isn't available
-            try:
-                from src.regex_mapper import find_statutes_in_text as finder
-                hits = finder(txt, patterns=patterns)
-            except Exception:
-                # fallback to expecting find_statutes_in_text defined in the notebook's global scope
-                hits = find_statutes_in_text(txt, patterns=patterns)
+            hits = finder(txt, patterns=patterns)
 
             for h in hits:
                 statute_raw = h.get("statute_raw") or h.get("match_text")
@@ -1,7 +1,10 @@
 # src/utils.py
 
 import re
+from functools import lru_cache
 
+# Pure and deterministic; judgments cite the same sections over and over
+@lru_cache(maxsize=4096)
 def normalize_to_ipc(raw: str) -> str | None:
     """
     Convert raw tokens like: